@@ -2,12 +2,14 @@
 import numpy as np
 
 from ..data import convert_to_dataset
+from ..stats.stats_utils import _autocorr_batch
 from .plot_utils import (
     _scale_fig_size,
     default_grid,
     xarray_var_iter,
     _create_axes_grid,
     filter_plotters_list,
+    get_plotting_function,
 )
 from ..utils import _var_names
 
@@ -36,7 +38,8 @@ def plot_autocorr(
         Variables to be plotted, if None all variable are plotted.
         Vector-value stochastics are handled automatically.
     max_lag : int, optional
-        Maximum lag to calculate autocorrelation. Defaults to 100 or num draws, whichever is smaller
+        Maximum lag to calculate autocorrelation. Defaults to 100 or half the number of draws,
+        whichever is smaller, as the autocorrelation estimates at longer lags are mostly noise.
     combined : bool
         Flag for combining multiple chains into a single chain. If False (default), chains will be
         plotted separately.
@@ -92,14 +95,21 @@ def plot_autocorr(
     data = convert_to_dataset(data, group="posterior")
     var_names = _var_names(var_names, data)
 
-    # Default max lag to 100 or max length of chain
+    # Default max lag to 100 or half the length of the chain
     if max_lag is None:
-        max_lag = min(100, data["draw"].shape[0])
+        max_lag = max(1, min(100, data["draw"].shape[0] // 2))
 
     plotters = filter_plotters_list(
         list(xarray_var_iter(data, var_names, combined)), "plot_autocorr"
     )
     length_plotters = len(plotters)
+    names, selections, values = zip(*plotters)
+    # Compute the autocorrelation of all the series at once
+    ary = np.empty((length_plotters, values[0].size))
+    for idx, value in enumerate(values):
+        ary[idx] = value.ravel()
+    # single precision is plenty for the plotted bars
+    acf = _autocorr_batch(ary, max_lag, copy=False, dtype=np.float32)
     rows, cols = default_grid(length_plotters)
 
     figsize, _, titlesize, xt_labelsize, linewidth, _ = _scale_fig_size(
@@ -120,29 +130,29 @@ def plot_autocorr(
     else:
         axes = ax
 
-    axes = np.atleast_2d(axes)  # in case of only 1 plot
+    # trimmed matplotlib grids are 1D and a user supplied ax may be a single axes
+    axes = np.atleast_2d(axes)
 
     autocorr_plot_args = dict(
         axes=axes,
-        plotters=plotters,
+        var_names=names,
+        selections=selections,
+        acf=acf,
         max_lag=max_lag,
-        combined=combined,
         linewidth=linewidth,
         xt_labelsize=xt_labelsize,
         titlesize=titlesize,
     )
 
-    if backend == "bokeh":
-        from .backends.bokeh.bokeh_autocorrplot import _plot_autocorr
+    _plot_autocorr = get_plotting_function("_plot_autocorr", "autocorrplot", backend)
 
+    if backend == "bokeh":
         autocorr_plot_args.pop("xt_labelsize")
         autocorr_plot_args.pop("titlesize")
         autocorr_plot_args["line_width"] = autocorr_plot_args.pop("linewidth")
         autocorr_plot_args["show"] = show
         axes = _plot_autocorr(**autocorr_plot_args)  # pylint: disable=unexpected-keyword-arg
     else:
-        from .backends.matplotlib.mpl_autocorrplot import _plot_autocorr
-
         axes = _plot_autocorr(**autocorr_plot_args)
 
     return axes
@@ -1,6 +1,19 @@
 # pylint: disable=no-member
 """Bokeh Plotting Backend."""
 
+_DEFAULT_BOKEH_TOOLS = [
+    "pan",
+    "wheel_zoom",
+    "box_zoom",
+    "lasso_select",
+    "poly_select",
+    "undo",
+    "redo",
+    "reset",
+    "save",
+    "hover",
+]
+
 
 def output_notebook(*args, **kwargs):
     """Wrap bokeh.plotting.output_notebook."""
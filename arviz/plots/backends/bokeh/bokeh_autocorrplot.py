@@ -4,19 +4,13 @@ import bokeh.plotting as bkp
 from bokeh.models.annotations import Title
 from bokeh.layouts import gridplot
 
-from ....stats import autocorr
 from ...plot_utils import make_label
 
 
 def _plot_autocorr(
-    axes, plotters, max_lag, line_width, combined=False, show=True,
+    axes, var_names, selections, acf, max_lag, line_width, show=True,
 ):
-    for (var_name, selection, x), ax_ in zip(plotters, axes.flatten()):
-        x_prime = x
-        if combined:
-            x_prime = x.flatten()
-        y = autocorr(x_prime)
-
+    for var_name, selection, y, ax_ in zip(var_names, selections, acf, axes.flat):
         ax_.segment(
             x0=np.arange(len(y)),
             y0=0,
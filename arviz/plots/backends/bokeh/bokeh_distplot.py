@@ -3,7 +3,8 @@ import bokeh.plotting as bkp
 import numpy as np
 
 from ...kdeplot import plot_kde
-from ...plot_utils import get_bins
+from ...plot_utils import _cached_get_bins
+from . import _DEFAULT_BOKEH_TOOLS
 
 
 def _plot_dist_bokeh(
@@ -31,20 +32,7 @@ def _plot_dist_bokeh(
 ):
 
     if ax is None:
-        tools = ",".join(
-            [
-                "pan",
-                "wheel_zoom",
-                "box_zoom",
-                "lasso_select",
-                "poly_select",
-                "undo",
-                "redo",
-                "reset",
-                "save,hover",
-            ]
-        )
-        ax = bkp.figure(width=500, height=500, output_backend="webgl", tools=tools)
+        ax = bkp.figure(width=500, height=500, output_backend="webgl", tools=_DEFAULT_BOKEH_TOOLS)
 
     if kind == "auto":
         kind = "hist" if values.dtype.kind == "i" else "kde"
@@ -112,14 +100,40 @@ def _histplot_bokeh_op(values, values2, rotated, ax, hist_kwargs):
 
     bins = hist_kwargs.pop("bins", None)
     if bins is None:
-        bins = get_bins(values)
+        bins = _cached_get_bins(values)
     density = hist_kwargs.pop("density", True)
-    hist, edges = np.histogram(values, density=density, bins=bins)
+    if values.dtype.kind == "i" and isinstance(bins, np.ndarray) and bins.dtype.kind == "i":
+        hist, edges = _histogram_int(values, bins, density)
+    else:
+        hist, edges = np.histogram(values, density=density, bins=bins)
     if hist_kwargs.pop("cumulative", False):
-        hist = np.cumsum(hist)
-        hist /= hist[-1]
+        total = hist.sum()
+        np.cumsum(hist, out=hist)
+        hist /= total
     if rotated:
         ax.quad(top=edges[:-1], bottom=edges[1:], left=0, right=hist, **hist_kwargs)
     else:
         ax.quad(top=hist, bottom=0, left=edges[:-1], right=edges[1:], **hist_kwargs)
     return ax
+
+
+def _histogram_int(values, bins, density):
+    """Compute the histogram of integer data over evenly spaced integer bins with bincount.
+
+    Produces the same result as ``np.histogram`` without searching the bin of each value.
+    It falls back to ``np.histogram`` when the bins are not evenly spaced or don't cover
+    all the data.
+    """
+    values = values.ravel()
+    width = bins[1] - bins[0] if bins.size > 1 else 0
+    if (
+        width <= 0
+        or np.any(np.diff(bins) != width)
+        or values.min() < bins[0]
+        or values.max() >= bins[-1]
+    ):
+        return np.histogram(values, density=density, bins=bins)
+    hist = np.bincount((values - bins[0]) // width, minlength=bins.size - 1)
+    if density:
+        hist = hist / (hist.sum() * width)
+    return hist, bins
@@ -3,6 +3,7 @@ import bokeh.plotting as bkp
 from bokeh.models import Label
 
 from ...kdeplot import plot_kde
+from . import _DEFAULT_BOKEH_TOOLS
 from .bokeh_distplot import _histplot_bokeh_op
 from ....stats import bfmi as e_bfmi
 
@@ -11,26 +12,11 @@ def _plot_energy(
     ax, series, energy, kind, bfmi, figsize, line_width, fill_kwargs, plot_kwargs, bw, legend, show,
 ):
     if ax is None:
-        tools = ",".join(
-            [
-                "pan",
-                "wheel_zoom",
-                "box_zoom",
-                "lasso_select",
-                "poly_select",
-                "undo",
-                "redo",
-                "reset",
-                "save",
-                "hover",
-            ]
-        )
-
         ax = bkp.figure(
             width=int(figsize[0] * 90),
             height=int(figsize[1] * 90),
             output_backend="webgl",
-            tools=tools,
+            tools=_DEFAULT_BOKEH_TOOLS,
         )
 
     if kind == "kde":
@@ -61,7 +47,7 @@ def _plot_energy(
             hist_kwargs["line_color"] = None
             hist_kwargs["line_alpha"] = alpha
             _histplot_bokeh_op(
-                value.flatten(), values2=None, rotated=False, ax=ax, hist_kwargs=hist_kwargs
+                value.ravel(), values2=None, rotated=False, ax=ax, hist_kwargs=hist_kwargs
             )
 
     else:
@@ -6,6 +6,7 @@ import numpy as np
 from ...distplot import plot_dist
 from ...kdeplot import plot_kde
 from ...plot_utils import make_label
+from . import _DEFAULT_BOKEH_TOOLS
 
 
 def _plot_joint(
@@ -22,38 +23,24 @@ def _plot_joint(
     show,
 ):
     if ax is None:
-
-        tools = ",".join(
-            [
-                "pan",
-                "wheel_zoom",
-                "box_zoom",
-                "lasso_select",
-                "poly_select",
-                "undo",
-                "redo",
-                "reset",
-                "save,hover",
-            ]
-        )
         axjoin = bkp.figure(
             width=int(figsize[0] * 90 * 0.8),
             height=int(figsize[1] * 90 * 0.8),
             output_backend="webgl",
-            tools=tools,
+            tools=_DEFAULT_BOKEH_TOOLS,
         )
         ax_hist_x = bkp.figure(
             width=int(figsize[0] * 90 * 0.8),
             height=int(figsize[1] * 90 * 0.2),
             output_backend="webgl",
-            tools=tools,
+            tools=_DEFAULT_BOKEH_TOOLS,
             x_range=axjoin.x_range,
         )
         ax_hist_y = bkp.figure(
             width=int(figsize[0] * 90 * 0.2),
             height=int(figsize[1] * 90 * 0.8),
             output_backend="webgl",
-            tools=tools,
+            tools=_DEFAULT_BOKEH_TOOLS,
             y_range=axjoin.y_range,
         )
 
@@ -71,8 +58,8 @@ def _plot_joint(
     axjoin.yaxis.axis_label = y_var_name
 
     # Flatten data
-    x = plotters[0][2].flatten()
-    y = plotters[1][2].flatten()
+    x = plotters[0][2].ravel()
+    y = plotters[1][2].ravel()
 
     if kind == "scatter":
         axjoin.circle(x, y, **joint_kwargs)
@@ -1,19 +1,14 @@
 """Matplotlib Autocorrplot."""
 import numpy as np
 
-from ....stats import autocorr
 from ...plot_utils import make_label
 
 
 def _plot_autocorr(
-    axes, plotters, max_lag, linewidth, titlesize, combined=False, xt_labelsize=None,
+    axes, var_names, selections, acf, max_lag, linewidth, titlesize, xt_labelsize=None,
 ):
-    for (var_name, selection, x), ax_ in zip(plotters, axes.flatten()):
-        x_prime = x
-        if combined:
-            x_prime = x.flatten()
-        y = autocorr(x_prime)
-        ax_.vlines(x=np.arange(0, max_lag), ymin=0, ymax=y[0:max_lag], lw=linewidth)
+    for var_name, selection, y, ax_ in zip(var_names, selections, acf, axes.flat):
+        ax_.vlines(x=np.arange(0, max_lag), ymin=0, ymax=y, lw=linewidth)
         ax_.hlines(0, 0, max_lag, "steelblue")
         ax_.set_title(make_label(var_name, selection), fontsize=titlesize, wrap=True)
         ax_.tick_params(labelsize=xt_labelsize)
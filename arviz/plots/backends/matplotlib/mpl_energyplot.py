@@ -1,5 +1,6 @@
 """Matplotlib energyplot."""
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 
 from ...kdeplot import plot_kde
 from ....stats import bfmi as e_bfmi
@@ -41,9 +42,10 @@ def _plot_energy(
             )
     elif kind in {"hist", "histogram"}:
         for alpha, color, label, value in series:
+            # energies are close to normal, Scott's rule avoids the percentiles of "auto"
             ax.hist(
-                value.flatten(),
-                bins="auto",
+                value.ravel(),
+                bins="scott",
                 density=True,
                 alpha=alpha,
                 label=label,
@@ -54,11 +56,13 @@ def _plot_energy(
     else:
         raise ValueError("Plot type {} not recognized.".format(kind))
 
-    if bfmi:
-        for idx, val in enumerate(e_bfmi(energy)):
-            ax.plot([], label="chain {:>2} BFMI = {:.2f}".format(idx, val), alpha=0)
     if legend:
-        ax.legend()
+        handles, labels = ax.get_legend_handles_labels()
+        if bfmi:
+            for idx, val in enumerate(e_bfmi(energy)):
+                handles.append(Line2D([], [], alpha=0))
+                labels.append("chain {:>2} BFMI = {:.2f}".format(idx, val))
+        ax.legend(handles, labels)
 
     ax.set_xticks([])
     ax.set_yticks([])
@@ -49,8 +49,8 @@ def _plot_joint(
     axjoin.tick_params(labelsize=xt_labelsize)
 
     # Flatten data
-    x = plotters[0][2].flatten()
-    y = plotters[1][2].flatten()
+    x = plotters[0][2].ravel()
+    y = plotters[1][2].ravel()
 
     if kind == "scatter":
         axjoin.scatter(x, y, **joint_kwargs)
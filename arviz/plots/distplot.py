@@ -1,6 +1,6 @@
 # pylint: disable=unexpected-keyword-arg
 """Plot distribution as histogram or kernel density estimates."""
-from .plot_utils import get_bins
+from .plot_utils import _cached_get_bins
 
 
 def plot_dist(
@@ -101,7 +101,8 @@ def plot_dist(
         if hist_kwargs is None:
             hist_kwargs = {}
 
-        hist_kwargs.setdefault("bins", get_bins(values))
+        if "bins" not in hist_kwargs:
+            hist_kwargs["bins"] = _cached_get_bins(values)
         hist_kwargs.setdefault("cumulative", cumulative)
         hist_kwargs.setdefault("color", color)
         hist_kwargs.setdefault("label", label)
@@ -1,6 +1,6 @@
 """Joint scatter plot of two variables."""
 from ..data import convert_to_dataset
-from .plot_utils import _scale_fig_size, xarray_var_iter, get_coords
+from .plot_utils import _scale_fig_size, xarray_var_iter, get_coords, get_plotting_function
 from ..utils import _var_names
 
 
@@ -159,9 +159,9 @@ def plot_joint(
         marginal_kwargs=marginal_kwargs,
     )
 
-    if backend == "bokeh":
-        from .backends.bokeh.bokeh_jointplot import _plot_joint
+    _plot_joint = get_plotting_function("_plot_joint", "jointplot", backend)
 
+    if backend == "bokeh":
         plot_joint_kwargs.pop("ax_labelsize")
         plot_joint_kwargs["marginal_kwargs"]["plot_kwargs"]["line_width"] = plot_joint_kwargs[
             "marginal_kwargs"
@@ -169,8 +169,6 @@ def plot_joint(
         plot_joint_kwargs["show"] = show
         axes = _plot_joint(**plot_joint_kwargs)  # pylint: disable=unexpected-keyword-arg
     else:
-        from .backends.matplotlib.mpl_jointplot import _plot_joint
-
         axes = _plot_joint(**plot_joint_kwargs)
 
     return axes
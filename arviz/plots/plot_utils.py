@@ -1,5 +1,8 @@
 """Utilities for plotting."""
+import functools
+import importlib
 import warnings
+import weakref
 from itertools import product, tee
 
 import numpy as np
@@ -10,6 +13,9 @@ import xarray as xr
 from ..utils import conditional_jit
 from ..rcparams import rcParams
 
+_BINS_CACHE = {}
+_BINS_CACHE_SIZE = 64
+
 
 def make_2d(ary):
     """Convert any array into a 2d numpy array.
@@ -130,6 +136,34 @@ def get_bins(values):
     return np.arange(x_min, x_max + width + 1, width)
 
 
+def _cached_get_bins(values):
+    """Memoized version of ``get_bins``.
+
+    A cached result is only reused for the very same array object, tracked through a weak
+    reference so entries are dropped together with their arrays, and only while its minimum
+    and maximum are unchanged, so arrays edited in place get new bins. The returned bins are
+    read only.
+    """
+    values = np.asarray(values)
+    key = id(values)
+    extremes = (values.min(), values.max())
+    entry = _BINS_CACHE.get(key)
+    if entry is not None and entry[0]() is values and entry[1] == extremes:
+        return entry[2]
+
+    def _drop(ref, key=key):
+        if _BINS_CACHE.get(key, (None,))[0] is ref:
+            del _BINS_CACHE[key]
+
+    bins = get_bins(values)
+    bins.flags.writeable = False
+    _BINS_CACHE.pop(key, None)
+    if len(_BINS_CACHE) >= _BINS_CACHE_SIZE:
+        _BINS_CACHE.pop(next(iter(_BINS_CACHE)))
+    _BINS_CACHE[key] = (weakref.ref(values, _drop), extremes, bins)
+    return bins
+
+
 def _sturges_formula(dataset, mult=1):
     """Use Sturges' formula to determine number of bins.
 
@@ -627,3 +661,37 @@ def filter_plotters_list(plotters, plot_kind):
         )
         return plotters[:max_plots]
     return plotters
+
+
+def get_plotting_function(plot_name, plot_module, backend):
+    """Return the plotting function of the given backend.
+
+    The backend module is only imported on the first call, later lookups are cached.
+
+    Parameters
+    ----------
+    plot_name : str
+        Name of the backend plotting function, for example ``"_plot_autocorr"``
+    plot_module : str
+        Name of the plot module without backend prefix, for example ``"autocorrplot"``
+    backend : str or None
+        "bokeh" or anything else for matplotlib
+
+    Returns
+    -------
+    plotting_function : callable
+    """
+    backend = "bokeh" if backend == "bokeh" else "matplotlib"
+    return _get_plotting_function(plot_name, plot_module, backend)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plotting_function(plot_name, plot_module, backend):
+    prefix = {"matplotlib": "mpl", "bokeh": "bokeh"}[backend]
+    module = importlib.import_module(
+        ".backends.{backend}.{prefix}_{plot_module}".format(
+            backend=backend, prefix=prefix, plot_module=plot_module
+        ),
+        package=__package__,
+    )
+    return getattr(module, plot_name)
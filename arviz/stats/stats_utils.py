@@ -5,13 +5,33 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from scipy.fftpack import next_fast_len
 from scipy.stats.mstats import mquantiles
+
+try:
+    # scipy.fft (scipy >= 1.4) caches the FFT plans between calls
+    from scipy.fft import rfft, irfft, next_fast_len as _next_fast_len
+
+    def next_fast_len(target):
+        """Find the next fast size for a real FFT."""
+        return _next_fast_len(target, True)
+
+    # transform the rows of batched FFTs in parallel threads
+    _FFT_BATCH_KWARGS = {"workers": -1}
+
+except ImportError:  # pragma: no cover
+    from scipy.fftpack import next_fast_len
+    from numpy.fft import rfft, irfft
+
+    _FFT_BATCH_KWARGS = {}
+
 from xarray import apply_ufunc
-from ..utils import conditional_jit
+from ..utils import conditional_jit, Numba
 
 _log = logging.getLogger(__name__)
 
+# Largest number of lags for which the direct (numba) autocorrelation beats the FFT one
+_AUTOCORR_DIRECT_MAX_LAG = 200
+
 __all__ = ["autocorr", "autocov", "ELPDData", "make_ufunc", "wrap_xarray_ufunc"]
 
 
@@ -31,19 +51,20 @@ def autocov(ary, axis=-1):
     n = ary.shape[axis]
     m = next_fast_len(2 * n)
 
+    ary = np.asarray(ary, dtype=float)
     ary = ary - ary.mean(axis, keepdims=True)
 
     # added to silence tuple warning for a submodule
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
 
-        ifft_ary = np.fft.rfft(ary, n=m, axis=axis)
+        ifft_ary = rfft(ary, n=m, axis=axis)
         ifft_ary *= np.conjugate(ifft_ary)
 
         shape = tuple(
             slice(None) if dim_len != axis else slice(0, n) for dim_len, _ in enumerate(ary.shape)
         )
-        cov = np.fft.irfft(ifft_ary, n=m, axis=axis)[shape]
+        cov = irfft(ifft_ary, n=m, axis=axis)[shape]
         cov /= n
 
     return cov
@@ -73,6 +94,69 @@ def autocorr(ary, axis=-1):
     return corr
 
 
+def _autocorr_batch(ary, max_lag, copy=True, dtype=np.float64):
+    """Compute the autocorrelation of every row of a 2D array up to ``max_lag``.
+
+    All the series are transformed together with a single FFT call along the last axis.
+    If numba is available and only a few lags are needed, the lags are computed directly
+    instead, which avoids the FFT overhead.
+
+    Parameters
+    ----------
+    ary : Numpy array
+        2D array of shape (n_series, n_draws)
+    max_lag : int
+        Number of lags to keep
+    copy : bool
+        If False, a float64 ``ary`` is centered in place, which avoids allocating a copy of it.
+    dtype : numpy dtype
+        Floating point type used for the FFT. The data is always centered in float64 first,
+        so ``np.float32`` only trades digits of the result for a faster, smaller transform.
+
+    Returns
+    -------
+    acorr: Numpy array of shape (n_series, max_lag)
+    """
+    max_lag = min(max_lag, ary.shape[-1])
+    if Numba.numba_flag and max_lag <= _AUTOCORR_DIRECT_MAX_LAG:
+        acov = _autocov_direct(np.asarray(ary, dtype=float), max_lag)
+    else:
+        ary = np.array(ary, dtype=float, copy=copy)
+        ary -= ary.mean(axis=-1, keepdims=True)
+        ary = ary.astype(dtype, copy=False)
+        n_fft = next_fast_len(2 * ary.shape[-1])
+        fft_ary = rfft(ary, n=n_fft, axis=-1, **_FFT_BATCH_KWARGS)
+        fft_ary *= np.conjugate(fft_ary)
+        acov = irfft(fft_ary, n=n_fft, axis=-1, **_FFT_BATCH_KWARGS)[:, :max_lag]
+    # Normalize every series by its lag 0 autocovariance in a single division
+    with np.errstate(invalid="ignore"):
+        acov /= acov[:, :1]
+    return acov
+
+
+# Only allow reassociation and contraction so that nan draws are still propagated
+@conditional_jit(cache=True, fastmath={"reassoc", "contract"})
+def _autocov_direct(ary, max_lag):
+    """Unnormalized autocovariance of every row of ``ary`` up to ``max_lag``."""
+    n_series, n_draws = ary.shape
+    acov = np.empty((n_series, max_lag))
+    centered = np.empty(n_draws)
+    for i in range(n_series):
+        mean = ary[i].mean()
+        # center and accumulate the lag 0 autocovariance in the same sweep
+        m_2 = 0.0
+        for j in range(n_draws):
+            centered[j] = ary[i, j] - mean
+            m_2 += centered[j] * centered[j]
+        acov[i, 0] = m_2
+        for lag in range(1, max_lag):
+            acov_lag = 0.0
+            for j in range(n_draws - lag):
+                acov_lag += centered[j] * centered[j + lag]
+            acov[i, lag] = acov_lag
+    return acov
+
+
 def make_ufunc(
     func, n_dims=2, n_output=1, n_input=1, index=Ellipsis, ravel=True, check_shape=None
 ):  # noqa: D202
@@ -9,9 +9,11 @@ from ..plots.plot_utils import (
     xarray_to_ndarray,
     xarray_var_iter,
     get_bins,
+    _cached_get_bins,
     get_coords,
     filter_plotters_list,
     format_sig_figs,
+    get_plotting_function,
 )
 from ..rcparams import rc_context
 
@@ -57,6 +59,29 @@ def test_get_bins():
     assert get_bins(np.array([1, 2, 3, 100])) is not None
 
 
+def test_cached_get_bins():
+    values = np.random.randint(0, 50, size=1000)
+    bins = _cached_get_bins(values)
+    assert np.all(bins == get_bins(values))
+    assert _cached_get_bins(values) is bins
+    assert _cached_get_bins(values.copy()) is not bins
+    values[1] = 120
+    assert np.all(_cached_get_bins(values) == get_bins(values))
+
+
+def test_cached_get_bins_freed_array():
+    values = np.zeros(1000, dtype=int)
+    values[-1] = 10
+    _cached_get_bins(values)
+    del values
+    for _ in range(20):
+        # same shape and same first, middle and last samples, but a wider range
+        new_values = np.random.randint(0, 50, size=1000)
+        new_values[[0, 500, -1]] = 0, 0, 10
+        assert np.all(_cached_get_bins(new_values) == get_bins(new_values))
+        del new_values
+
+
 def test_dataset_to_numpy_not_combined(sample_dataset):  # pylint: disable=invalid-name
     mu, tau, data = sample_dataset
     var_names, data = xarray_to_ndarray(data, combined=False)
@@ -190,3 +215,10 @@ def test_filter_plotter_list_warning():
         with pytest.warns(SyntaxWarning, match="test warning"):
             plotters_filtered = filter_plotters_list(plotters, "test warning")
     assert len(plotters_filtered) == 5
+
+
+@pytest.mark.parametrize("backend", [None, "matplotlib", "bokeh"])
+def test_get_plotting_function(backend):
+    plotting_function = get_plotting_function("_plot_autocorr", "autocorrplot", backend)
+    assert callable(plotting_function)
+    assert plotting_function is get_plotting_function("_plot_autocorr", "autocorrplot", backend)
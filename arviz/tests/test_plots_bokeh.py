@@ -33,6 +33,8 @@ from ..plots import (
     plot_trace,
     plot_parallel,
 )
+from ..plots.backends.bokeh.bokeh_distplot import _histogram_int
+from ..plots.plot_utils import get_bins
 from ..stats import compare, loo, waic
 
 rcParams["data.load"] = "eager"
@@ -177,12 +179,31 @@ def test_plot_kde_cumulative(continuous_model, kwargs):
     assert axes
 
 
-@pytest.mark.parametrize("kwargs", [{"kind": "hist"}, {"kind": "kde"}])
+@pytest.mark.parametrize(
+    "kwargs", [{"kind": "hist"}, {"kind": "hist", "cumulative": True}, {"kind": "kde"}]
+)
 def test_plot_dist(continuous_model, kwargs):
     axes = plot_dist(continuous_model["x"], backend="bokeh", show=False, **kwargs)
     assert axes
 
 
+def test_plot_dist_discrete(discrete_model):
+    axes = plot_dist(discrete_model["x"], backend="bokeh", show=False)
+    assert axes
+
+
+@pytest.mark.parametrize("density", [True, False])
+@pytest.mark.parametrize("bins", [None, np.arange(-3, 30, 3), np.array([0, 1, 5, 10])])
+def test_histogram_int(bins, density):
+    values = np.random.poisson(5, size=1000)
+    if bins is None:
+        bins = get_bins(values)
+    hist, edges = _histogram_int(values, bins, density)
+    hist_np, edges_np = np.histogram(values, bins=bins, density=density)
+    assert np.allclose(hist, hist_np)
+    assert np.all(edges == edges_np)
+
+
 def test_plot_kde_1d(continuous_model):
     axes = plot_kde(continuous_model["y"], backend="bokeh", show=False)
     assert axes
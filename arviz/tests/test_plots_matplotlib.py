@@ -210,6 +210,14 @@ def test_plot_energy(models, kind):
     assert plot_energy(models.model_1, kind=kind)
 
 
+@pytest.mark.parametrize("bfmi", [True, False])
+def test_plot_energy_bfmi_legend(models, bfmi):
+    ax = plot_energy(models.model_1, bfmi=bfmi)
+    n_chains = models.model_1.sample_stats.chain.size
+    n_labels = len(ax.get_legend().get_texts())
+    assert n_labels == 2 + n_chains if bfmi else n_labels == 2
+
+
 def test_plot_energy_bad(models):
     with pytest.raises(ValueError):
         plot_energy(models.model_1, kind="bad_kind")
@@ -14,7 +14,12 @@ from ..stats.stats_utils import (
     ELPDData,
     stats_variance_2d,
     histogram,
+    autocorr,
+    autocov,
+    _autocorr_batch,
+    _autocov_direct,
 )
+from ..utils import Numba
 
 
 @pytest.mark.parametrize("ary_dtype", [np.float64, np.float32, np.int32, np.int64])
@@ -255,3 +260,39 @@ def test_histogram():
     _, k_count, _ = histogram(school, bins=np.asarray([-np.Inf, 0.5, 0.7, 1, np.Inf]))
     kcount, *_ = np.histogram(school, bins=[-np.Inf, 0.5, 0.7, 1, np.Inf], density=True)
     assert np.allclose(k_count, kcount)
+
+
+@pytest.mark.parametrize("max_lag", [1, 10, 100, 300])
+def test_autocorr_batch(max_lag):
+    """Test the batched autocorrelation against the row by row computation."""
+    data = np.random.randn(6, 500)
+    acf = _autocorr_batch(data, max_lag)
+    assert acf.shape == (6, max_lag)
+    for acf_row, row in zip(acf, data):
+        assert np.allclose(acf_row, autocorr(row)[:max_lag])
+    assert np.allclose(_autocorr_batch(data.copy(), max_lag, copy=False), acf)
+    assert np.allclose(_autocorr_batch(data, max_lag, dtype=np.float32), acf, atol=1e-5)
+
+
+@pytest.mark.parametrize("func", [autocov, autocorr])
+def test_autocov_single_precision_input(func):
+    """Test that float32 input is still computed and returned in double precision."""
+    data = np.random.randn(4, 100)
+    result = func(data.astype(np.float32))
+    assert result.dtype == np.float64
+    assert np.allclose(result, func(data.astype(np.float32).astype(np.float64)))
+
+
+@pytest.mark.parametrize("max_lag", [1, 10, 100])
+def test_autocov_direct(max_lag):
+    """Test the direct autocovariance against the FFT one, with and without numba."""
+    state = Numba.numba_flag
+    data = np.random.randn(6, 500)
+    fft_acf = autocov(data)[:, :max_lag] * data.shape[-1]
+    Numba.disable_numba()
+    non_numba = _autocov_direct(data, max_lag)
+    Numba.enable_numba()
+    with_numba = _autocov_direct(data, max_lag)
+    assert np.allclose(non_numba, fft_acf)
+    assert np.allclose(with_numba, fft_acf)
+    assert state == Numba.numba_flag